@@ -0,0 +1,11 @@
+# cython: language_level=3
+# Compiled baseline for the Test 1 arithmetic kernel.
+# Build with: python setup.py build_ext --inplace
+
+
+def arith(long n):
+    cdef double s = 0.0
+    cdef long i
+    for i in range(n):
+        s = ((s + i * 2 - 1) / 1.1) % 10000.0
+    return s
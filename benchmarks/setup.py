@@ -0,0 +1,12 @@
+# Builds the optional Cython arithmetic kernel used by the Python benchmarks:
+#   python benchmarks/setup.py build_ext --inplace
+# Paths are resolved from this file's directory, so the extension lands next
+# to the benchmark scripts whichever directory the command is run from.
+import os
+
+from Cython.Build import cythonize
+from setuptools import setup
+
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+setup(ext_modules=cythonize("_arith.pyx"))